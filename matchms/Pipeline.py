@@ -1,7 +1,8 @@
 import logging
+import os
 from collections import OrderedDict
 from datetime import datetime
-from typing import Iterable, List, Optional, Union
+from typing import Iterable, List, Optional, Tuple, Union
 import matchms.similarity as mssimilarity
 from matchms import calculate_scores
 from matchms.filtering.filter_order_and_default_pipelines import ALL_FILTERS
@@ -10,6 +11,7 @@ from matchms.importing.load_spectra import load_list_of_spectrum_files
 from matchms.logging_functions import (add_logging_to_file,
                                        reset_matchms_logger,
                                        set_matchms_logger_level)
+from matchms.Spectrum import Spectrum
 from matchms.typing import SpectrumType
 from matchms.yaml_file_functions import (load_workflow_from_yaml_file,
                                          ordered_dump)
@@ -181,13 +183,18 @@ class Pipeline:
         assert set(self.__workflow.keys()) == expected_keys
         check_score_computation(score_computations=self.score_computations)
 
-    def run(self, query_files, reference_files = None):
+    def run(self,
+            query_files: Union[List[str], str, Iterable[SpectrumType]],
+            reference_files: Optional[Union[List[str], str, Iterable[SpectrumType]]] = None):
         """Execute the defined Pipeline workflow.
 
         This method will execute all steps of the workflow.
         1) Initializing the log file and importing the spectrums
         2) Spectrum processing (using matchms filters)
         3) Score Computations
+
+        Instead of file names, already loaded spectra (e.g. a list) can also be given for
+        query_files and reference_files. Those spectra will not be modified.
         """
         self.set_logging()
         self.write_to_logfile("--- Start running matchms pipeline. ---")
@@ -293,23 +300,25 @@ class Pipeline:
                 f.write(line + '\n')
 
     def import_spectrums(self,
-                         query_files: Union[List[str], str],
-                         reference_files: Optional[Union[List[str], str]] = None):
+                         query_files: Union[List[str], str, Iterable[SpectrumType]],
+                         reference_files: Optional[Union[List[str], str, Iterable[SpectrumType]]] = None):
         """Import spectra from file(s).
 
         Parameters
         ----------
         query_files
             List of files, or single filename, containing the query spectra.
+            Can also be a list (or other iterable) of already loaded spectra.
         reference_files
             List of files, or single filename, containing the reference spectra.
+            Can also be a list (or other iterable) of already loaded spectra.
             If set to None (default) then all query spectra will be compared to each other.
         """
         # import query spectra
         self.write_to_logfile("--- Importing data ---")
-        self._spectrums_queries = load_list_of_spectrum_files(query_files)
+        self._spectrums_queries, source = _load_spectra(query_files)
 
-        self.write_to_logfile(f"Loaded query spectra from {query_files}")
+        self.write_to_logfile(f"Loaded query spectra from {source}")
 
         # import reference spectra
         if reference_files is None:
@@ -317,8 +326,8 @@ class Pipeline:
             self._spectrums_references = self._spectrums_queries
             self.write_to_logfile("Reference spectra are equal to the query spectra (is_symmetric = True)")
         else:
-            self._spectrums_references = load_list_of_spectrum_files(reference_files)
-            self.write_to_logfile(f"Loaded reference spectra from {reference_files}")
+            self._spectrums_references, source = _load_spectra(reference_files)
+            self.write_to_logfile(f"Loaded reference spectra from {source}")
 
     # Getter & Setters
     @property
@@ -357,6 +366,31 @@ class Pipeline:
         return self._spectrums_references
 
 
+def _load_spectra(spectra_or_files: Union[List[str], str, Iterable[SpectrumType]]
+                  ) -> Tuple[Iterable[SpectrumType], str]:
+    """Load spectra from file(s), or use the given spectra if they were loaded already.
+
+    Returns the spectra and a description of where they came from, to be used in the log file.
+    None entries are skipped, like SpectrumProcessor does for spectra that were removed by a filter.
+    """
+    if isinstance(spectra_or_files, str):
+        return load_list_of_spectrum_files(spectra_or_files), spectra_or_files
+    try:
+        spectra_or_files = [element for element in spectra_or_files if element is not None]
+    except TypeError as error:
+        raise TypeError("Expected a filename, a list of filenames or a sequence of spectra, "
+                        f"not {type(spectra_or_files).__name__}.") from error
+    if len(spectra_or_files) == 0:
+        raise ValueError("Expected a filename, a list of filenames or a sequence of spectra, but got nothing.")
+    if all(isinstance(spectrum, Spectrum) for spectrum in spectra_or_files):
+        return spectra_or_files, f"{len(spectra_or_files)} already loaded spectra"
+    if all(isinstance(file, (str, os.PathLike)) for file in spectra_or_files):
+        return load_list_of_spectrum_files(spectra_or_files), str(spectra_or_files)
+    types = sorted({type(element).__name__ for element in spectra_or_files})
+    raise TypeError("Expected either only filenames or only spectra, "
+                    f"but got elements of type {', '.join(types)}.")
+
+
 def get_unused_filters(yaml_file):
     """Prints all filter names that are in ALL_FILTERS, but not in the yaml file"""
     workflow = load_workflow_from_yaml_file(yaml_file)
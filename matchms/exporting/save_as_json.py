@@ -1,11 +1,11 @@
 import copy
 import json
-from typing import List
+from typing import List, TextIO, Union
 from ..Spectrum import Spectrum
 from ..utils import fingerprint_export_warning
 
 
-def save_as_json(spectrums: List[Spectrum], filename: str):
+def save_as_json(spectrums: List[Spectrum], filename: Union[str, TextIO]):
     """Save spectrum(s) as json file.
 
     :py:attr:`~matchms.Spectrum.losses` of spectrum will not be saved.
@@ -28,12 +28,16 @@ def save_as_json(spectrums: List[Spectrum], filename: str):
         # Write spectrum to test file
         save_as_json(spectrum, "test.json")
 
+        # Or write it to a file-like object
+        with open("test.json", "w", encoding="utf-8") as spectra_file:
+            save_as_json(spectrum, spectra_file)
+
     Parameters
     ----------
     spectrums:
         Expected input is a list of  :py:class:`~matchms.Spectrum.Spectrum` objects.
     filename:
-        Provide filename to save spectrum(s).
+        Provide filename to save spectrum(s), or a file-like object opened for writing text.
     """
     if not isinstance(spectrums, list):
         # Assume that input was single Spectrum
@@ -42,6 +46,9 @@ def save_as_json(spectrums: List[Spectrum], filename: str):
     fingerprint_export_warning(spectrums)
 
     # Write to json file
+    if hasattr(filename, "write"):
+        json.dump(spectrums, filename, cls=SpectrumJSONEncoder)
+        return
     with open(filename, "w", encoding="utf-8") as fout:
         json.dump(spectrums, fout, cls=SpectrumJSONEncoder)
 
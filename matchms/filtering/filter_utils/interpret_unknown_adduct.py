@@ -2,7 +2,9 @@
 
 import logging
 import re
-from typing import List, Optional, Tuple
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple
+import numpy as np
 from matchms.constants import ELECTRON_MASS
 
 
@@ -27,6 +29,17 @@ rdkit_missing_message = "Conda package 'rdkit' is required for this functionalit
 
 logger = logging.getLogger("matchms")
 
+_RE_IONS_PART = re.compile(r"\[(.*)\]")
+_RE_CHARGE = re.compile(r"\]([0-9]?[+-])")
+_RE_FORMULA_PARTS = re.compile(r"[A-Z][a-z]?|[0-9]+")
+_SIGNS = ("+", "-")
+_DIGITS = "0123456789"
+_ALPHANUMERIC = _DIGITS + "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+# Derived from https://github.com/pnnl/MSAC
+_ABBREV_TO_FORMULA = {'ACN': 'CH3CN', 'DMSO': 'C2H6OS', 'FA': 'CH2O2',
+                      'HAc': 'CH3COOH', 'Hac': 'CH3COOH', 'TFA': 'C2HF3O2',
+                      'IsoProp': 'CH3CHOHCH3', 'MeOH': 'CH3OH'}
+
 
 def get_multiplier_and_mass_from_adduct(adduct: str) -> Tuple[Optional[float], Optional[float]]:
     """Get multiplier for charge and the correction mass of an adduct.
@@ -42,14 +55,41 @@ def get_multiplier_and_mass_from_adduct(adduct: str) -> Tuple[Optional[float], O
     """
     if adduct is None or not isinstance(adduct, str):
         return None, None
+    multiplier_and_mass = _COMMON_ADDUCT_MULTIPLIERS_AND_MASSES.get(adduct)
+    if multiplier_and_mass is not None:
+        return multiplier_and_mass
+    return _get_multiplier_and_mass_from_adduct(adduct)
 
-    charge = get_charge_of_adduct(adduct)
-    if charge is None:
-        return None, None
 
-    nr_of_parent_masses, ions = get_ions_from_adduct(adduct)
+def get_multiplier_and_mass_from_adducts(adducts: Sequence[Optional[str]]) -> Tuple[np.ndarray, np.ndarray]:
+    """Get multipliers for charge and the correction masses for many adducts at once.
+
+    Each distinct adduct is only interpreted once (using the cached get_multiplier_and_mass_from_adduct),
+    the results are then mapped back to all adducts.
+    Adducts which can not be interpreted get NaN as multiplier and correction mass.
+
+    Args:
+        adducts (Sequence[Optional[str]]): String descriptions of the adducts. e.g. ['[M+H]+', '[M+Na]+', '[M+H]+']
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Multipliers and masses of these adducts.
+    """
+    index_of_adduct = {}
+    inverse = np.fromiter((index_of_adduct.setdefault(adduct if isinstance(adduct, str) else None, len(index_of_adduct))
+                           for adduct in adducts), dtype=np.int64)
+    multipliers_and_masses = np.array([get_multiplier_and_mass_from_adduct(adduct) for adduct in index_of_adduct],
+                                      dtype=float).reshape(-1, 2)
+    return multipliers_and_masses[inverse, 0], multipliers_and_masses[inverse, 1]
+
 
-    if nr_of_parent_masses is None or ions is None:
+@lru_cache(maxsize=4096)
+def _get_multiplier_and_mass_from_adduct(adduct: str) -> Tuple[Optional[float], Optional[float]]:
+    """Cached computation of get_multiplier_and_mass_from_adduct.
+
+    The same few adducts occur over and over in a dataset, so each one only has to be interpreted once.
+    """
+    charge, nr_of_parent_masses, ions = _parse_adduct(adduct)
+    if not charge or nr_of_parent_masses is None or ions is None:
         return None, None
 
     mass_of_ions = get_mass_of_ion(ions)
@@ -62,35 +102,17 @@ def get_multiplier_and_mass_from_adduct(adduct: str) -> Tuple[Optional[float], O
     return multiplier, correction_mass
 
 
-def get_ions_from_adduct(adduct: str) -> Tuple[int, List[str]]:
+def get_ions_from_adduct(adduct: str) -> Tuple[Optional[int], Optional[List[Tuple[str, int, str]]]]:
     """Returns a list of ions from an adduct and returns the number of parent masses
 
-    e.g. '[M+H-H2O]2+' -> (1, ["+H", "-H2O"])
+    Each ion is given as sign, number and formula.
+    e.g. '[M+H-H2O]2+' -> (1, [("+", 1, "H"), ("-", 1, "H2O")])
     """
-
-    # Get adduct from brackets
     if "[" in adduct:
-        ions_part = re.findall((r"\[(.*)\]"), adduct)
-        if len(ions_part) != 1:
-            logger.warning("Expected to find brackets [] once, not the case in %s",
-                           adduct)
+        adduct = _get_ions_part(adduct)
+        if adduct is None:
             return None, None
-        adduct = ions_part[0]
-    # Finds the pattern M or 2M in adduct it makes sure it is in between
-    parent_mass = re.findall(r'(?:^|[+-])([0-9]?M)(?:$|[+-])', adduct)
-    if len(parent_mass) != 1:
-        logger.warning("The parent mass (e.g. 2M or M) was found %s times in %s",
-                       len(parent_mass), adduct)
-        return None, None
-    parent_mass = parent_mass[0]
-    if parent_mass == "M":
-        nr_of_parent_masses = 1
-    else:
-        nr_of_parent_masses = int(parent_mass[0])
-
-    ions_split = re.findall(r'([+-][0-9a-zA-Z]+)', adduct)
-    ions_split = replace_abbreviations(ions_split)
-    return nr_of_parent_masses, ions_split
+    return _parse_ions(adduct.strip())
 
 
 def split_ion(ion: str) -> Tuple[str, int, str]:
@@ -104,70 +126,58 @@ def split_ion(ion: str) -> Tuple[str, int, str]:
         Tuple[str, str, str]: Components of the ion descirption.
     """
     sign = ion[0]
-    ion = ion[1:]
-    assert sign in ["+", "-"], "Expected ion to start with + or -"
-    match = re.match(r'^([0-9]+)(.*)', ion)
-    if match:
-        number = int(match.group(1))
-        ion = match.group(2)
-    else:
-        number = 1
-    return sign, number, ion
-
-
-def replace_abbreviations(ions_split):
-    """Derived from https://github.com/pnnl/MSAC"""
-    abbrev_to_formula = {'ACN': 'CH3CN', 'DMSO': 'C2H6OS', 'FA': 'CH2O2',
-                         'HAc': 'CH3COOH', 'Hac': 'CH3COOH', 'TFA': 'C2HF3O2',
-                         'IsoProp': 'CH3CHOHCH3', 'MeOH': 'CH3OH'}
-    corrected_ions = []
-    for ion in ions_split:
-        sign, number, ion = split_ion(ion)
-        ion = abbrev_to_formula.get(ion, ion)
-        corrected_ions.append(sign + str(number) + ion)
-    return corrected_ions
-
-
-def get_mass_of_ion(ions):
-    """Derived from https://github.com/pnnl/MSAC"""
-    added_mass = 0
-    for ion in ions:
-        sign, number, ion = split_ion(ion)
-        atom_mass = get_mass_of_formula(ion)
-        if atom_mass is None:
-            return None
+    if sign not in _SIGNS:
+        raise ValueError(f"Expected ion to start with + or -, not {sign!r}")
+    number, end = _read_number(ion, 1)
+    return sign, number, ion[end:]
+
+
+def replace_abbreviations(ions: List[Tuple[str, int, str]]) -> List[Tuple[str, int, str]]:
+    """Derived from https://github.com/pnnl/MSAC
 
-        if sign == "-":
-            number = -int(number)
-        else:
-            number = int(number)
-        added_mass += number * atom_mass
+    e.g. [("+", 1, "ACN")] -> [("+", 1, "CH3CN")]
+    """
+    return [(sign, number, _ABBREV_TO_FORMULA.get(formula, formula)) for sign, number, formula in ions]
+
+
+def get_mass_of_ion(ions: List[Tuple[str, int, str]]) -> Optional[float]:
+    """Derived from https://github.com/pnnl/MSAC
+
+    e.g. [("+", 1, "H"), ("-", 1, "H2O")] -> -17.003
+    """
+    added_mass = 0.0
+    for sign, number, formula in ions:
+        mass = _get_mass_of_ion_formula(formula)
+        if mass is None:
+            return None
+        added_mass += number * mass if sign == "+" else -number * mass
     return added_mass
 
 
+def _get_mass_of_ion_formula(formula: str) -> Optional[float]:
+    """Looks up the mass of a formula in _ION_MASS_CACHE and adds it if it is missing."""
+    mass = _ION_MASS_CACHE.get(formula)
+    if mass is None:
+        mass = get_mass_of_formula(formula)
+        if mass is not None:
+            _ION_MASS_CACHE[formula] = mass
+    return mass
+
+
 def get_charge_of_adduct(adduct) -> Optional[int]:
     """Returns the charge of an adduct
 
     e.g. '[M+H-H2O]2+' -> 2
     """
-
-    charge = re.findall((r"\]([0-9]?[+-])"), adduct)
+    charge = _RE_CHARGE.findall(adduct)
     if len(charge) != 1:
-        logger.warning("Charge was found %s times in adduct %s",
-                       len(charge), adduct)
+        logger.warning("Charge was found %s times in adduct %s", len(charge), adduct)
         return None
     charge = charge[0]
-    if len(charge) == 1:
-        # The charge is + or -
-        charge_size = "1"
-        charge_sign = charge
-    elif len(charge) == 2:
-        charge_size = charge[0]
-        charge_sign = charge[1]
-    else:
-        logger.warning("Charge is expected of length 1 or 2, but %s was given", charge)
-        return None
-    return int(charge_sign+charge_size)
+    charge_size = int(charge[0]) if len(charge) == 2 else 1
+    if charge[-1] == "-":
+        return -charge_size
+    return charge_size
 
 
 def get_mass_of_formula(formula):
@@ -178,7 +188,7 @@ def get_mass_of_formula(formula):
     """
     if not _has_rdkit:
         raise ImportError(rdkit_missing_message)
-    parts = re.findall("[A-Z][a-z]?|[0-9]+", formula)
+    parts = _RE_FORMULA_PARTS.findall(formula)
     mass = 0
 
     for i, part in enumerate(parts):
@@ -193,3 +203,91 @@ def get_mass_of_formula(formula):
         multiplier = int(parts[i + 1]) if len(parts) > i + 1 and parts[i + 1].isnumeric() else 1
         mass += atom_mass * multiplier
     return mass
+
+
+def _parse_adduct(adduct: str) -> Tuple[Optional[int], Optional[int], Optional[List[Tuple[str, int, str]]]]:
+    """Interprets the charge, parent mass and ions of an adduct.
+
+    e.g. '[M+H-H2O]2+' -> (2, 1, [("+", 1, "H"), ("-", 1, "H2O")])
+    Returns None for all three if the adduct could not be interpreted.
+    """
+    charge = get_charge_of_adduct(adduct)
+    if charge is None:
+        return None, None, None
+    ions_part = _get_ions_part(adduct)
+    if ions_part is None:
+        return None, None, None
+    nr_of_parent_masses, ions = _parse_ions(ions_part)
+    return charge, nr_of_parent_masses, ions
+
+
+def _get_ions_part(adduct: str) -> Optional[str]:
+    """Returns the part of an adduct within the outer brackets.
+
+    e.g. '[M+H-H2O]2+' -> 'M+H-H2O'
+    Text outside the brackets, like the radical mark in '[M]+.', is ignored.
+    """
+    ions_part = _RE_IONS_PART.findall(adduct)
+    if len(ions_part) != 1:
+        logger.warning("Expected to find brackets [] once, not the case in %s", adduct)
+        return None
+    return ions_part[0]
+
+
+def _parse_ions(ions_part: str) -> Tuple[Optional[int], Optional[List[Tuple[str, int, str]]]]:
+    """Interprets the part of an adduct within the brackets.
+
+    e.g. '2M+H-H2O' -> (2, [("+", 1, "H"), ("-", 1, "H2O")])
+    Abbreviations such as ACN are directly replaced by their formula.
+    """
+    # The parent mass is M or a single digit followed by M
+    if ions_part[:1] and ions_part[0] in _DIGITS:
+        nr_of_parent_masses, i = int(ions_part[0]), 1
+    else:
+        nr_of_parent_masses, i = 1, 0
+    if ions_part[i:i + 2] not in ("M", "M+", "M-"):
+        logger.warning("The parent mass (e.g. 2M or M) was not found at the start of %s", ions_part)
+        return None, None
+    ions = []
+    i += 1
+    while i < len(ions_part):
+        sign = ions_part[i]
+        number, i = _read_number(ions_part, i + 1)
+        start = i
+        while i < len(ions_part) and ions_part[i] in _ALPHANUMERIC:
+            i += 1
+        if i < len(ions_part) and ions_part[i] not in _SIGNS:
+            logger.warning("Unexpected character %s in adduct %s", ions_part[i], ions_part)
+            return None, None
+        formula = ions_part[start:i]
+        if formula == "M":
+            logger.warning("The parent mass (e.g. 2M or M) was found more than once in %s", ions_part)
+            return None, None
+        ions.append((sign, number, _ABBREV_TO_FORMULA.get(formula, formula)))
+    return nr_of_parent_masses, ions
+
+
+def _read_number(text: str, start: int) -> Tuple[int, int]:
+    """Reads the digits in text from position start on (1 if there are none) and returns the next position."""
+    i = start
+    while i < len(text) and text[i] in _DIGITS:
+        i += 1
+    if i == start:
+        return 1, i
+    return int(text[start:i]), i
+
+
+# Formulas of ions that are common in adducts, besides the ones abbreviations are replaced by
+_COMMON_ION_FORMULAS = ("H", "Li", "Na", "K", "Mg", "Ca", "Fe", "Cu", "Zn", "NH4", "NH3", "H2O", "O", "OH",
+                        "F", "Cl", "Br", "I", "CH3", "CO2", "HCOO", "CH3COO", "C2H3O2", "CHO2", "HCOOH")
+# Most frequent adducts, their multiplier and mass are computed once and looked up directly
+_COMMON_ADDUCTS = ("[M+H]+", "[M-H]-", "[M+Na]+", "[M+K]+", "[M+NH4]+", "[M+H-H2O]+", "[M+Cl]-",
+                   "[M+HCOO]-", "[M+CH3COO]-", "[2M+H]+", "[2M-H]-")
+if _has_rdkit:
+    _ION_MASS_CACHE = {formula: get_mass_of_formula(formula)
+                       for formula in _COMMON_ION_FORMULAS + tuple(_ABBREV_TO_FORMULA.values())}
+    _COMMON_ADDUCT_MULTIPLIERS_AND_MASSES = {adduct: _get_multiplier_and_mass_from_adduct(adduct)
+                                             for adduct in _COMMON_ADDUCTS}
+else:
+    _ION_MASS_CACHE = {}
+    _COMMON_ADDUCT_MULTIPLIERS_AND_MASSES = {}
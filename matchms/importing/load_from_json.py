@@ -1,7 +1,7 @@
 import ast
 import json
 import logging
-from typing import List, Union
+from typing import List, TextIO, Union
 import numpy as np
 from ..Spectrum import Spectrum
 
@@ -9,7 +9,7 @@ from ..Spectrum import Spectrum
 logger = logging.getLogger("matchms")
 
 
-def load_from_json(filename: str,
+def load_from_json(filename: Union[str, TextIO],
                    metadata_harmonization: bool = True) -> List[Spectrum]:
     """Load spectrum(s) from json file.
 
@@ -25,21 +25,29 @@ def load_from_json(filename: str,
         file_json = "gnps_testdata.json"
         spectrums = load_from_json(file_json)
 
+        # Or you can read the file in your application
+        with open(file_json, "r", encoding="utf-8") as spectra_file:
+            spectrums = load_from_json(spectra_file)
+
     Parameters
     ----------
     filename
-        Provide filename for json file containing spectrum(s).
+        Provide filename for json file containing spectrum(s), or a file-like object of such a file.
     metadata_harmonization : bool, optional
         Set to False if metadata harmonization to default keys is not desired.
         The default is True.
     """
-    with open(filename, 'rb') as fin:
-        spectrums = []
-        for spectrum_dict in json.load(fin):
-            spectrum = as_spectrum(spectrum_dict, metadata_harmonization=metadata_harmonization)
-            if spectrum is not None:
-                spectrums.append(spectrum)
-
+    if hasattr(filename, "read"):
+        spectrum_dicts = json.load(filename)
+    else:
+        with open(filename, 'rb') as fin:
+            spectrum_dicts = json.load(fin)
+
+    spectrums = []
+    for spectrum_dict in spectrum_dicts:
+        spectrum = as_spectrum(spectrum_dict, metadata_harmonization=metadata_harmonization)
+        if spectrum is not None:
+            spectrums.append(spectrum)
     return spectrums
 
 
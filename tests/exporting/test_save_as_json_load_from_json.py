@@ -1,3 +1,4 @@
+import io
 import json
 import os
 import numpy as np
@@ -7,12 +8,13 @@ from matchms.importing import load_from_json
 from tests.builder_Spectrum import SpectrumBuilder
 
 
+_MZ = np.array([100, 200, 300], dtype="float")
+_INTENSITIES = np.array([10, 10, 500], dtype="float")
+
+
 @pytest.fixture
 def builder() -> SpectrumBuilder:
-    mz = np.array([100, 200, 300], dtype="float")
-    intensities = np.array([10, 10, 500], dtype="float")
-    builder = SpectrumBuilder().with_mz(mz).with_intensities(intensities)
-    return builder
+    return SpectrumBuilder().with_mz(_MZ.copy()).with_intensities(_INTENSITIES.copy())
 
 
 def load_test_spectra_file(test_filename):
@@ -40,52 +42,39 @@ def test_save_and_load_json_single_spectrum(tmp_path, builder):
 
 
 @pytest.mark.parametrize("metadata_harmonization", [True, False])
-def test_save_and_load_json_spectrum_list(metadata_harmonization, tmp_path, builder):
-    """Test saving spectrum list to .json file"""
+def test_save_and_load_json_spectrum_list(metadata_harmonization, builder):
+    """Test saving spectrum list to json (in memory)"""
     spectrum1 = builder.with_metadata({"test_field": "test1"},
                                       metadata_harmonization=metadata_harmonization).build()
     spectrum2 = builder.with_metadata({"test_field": "test2"},
                                       metadata_harmonization=metadata_harmonization).build()
 
-    # Write to test file
-    filename = os.path.join(tmp_path, "test.json")
-    save_as_json([spectrum1, spectrum2], filename)
+    json_buffer = io.StringIO()
+    save_as_json([spectrum1, spectrum2], json_buffer)
+    json_buffer.seek(0)
 
-    # test if file exists
-    assert os.path.isfile(filename)
-
-    # Test if content of json file is correct
-    spectrum_imports = load_from_json(filename, metadata_harmonization=metadata_harmonization)
+    # Test if content of json is correct
+    spectrum_imports = load_from_json(json_buffer, metadata_harmonization=metadata_harmonization)
     assert spectrum_imports[0] == spectrum1, "Original and saved+loaded spectrum not identical"
     assert spectrum_imports[1] == spectrum2, "Original and saved+loaded spectrum not identical"
 
 
-
-
-def test_load_from_json_zero_peaks(tmp_path):
+def test_load_from_json_zero_peaks():
     spectrum1 = SpectrumBuilder().with_metadata(
         {"test_field": "test1"}).build()
 
-    filename = tmp_path / "test.json"
-
-    save_as_json([spectrum1], filename)
-
-    # test if file exists
-    assert os.path.isfile(filename)
+    json_buffer = io.StringIO()
+    save_as_json([spectrum1], json_buffer)
+    json_buffer.seek(0)
 
-    # Test if content of json file is correct
-    spectrum_imports = load_from_json(filename)
+    spectrum_imports = load_from_json(json_buffer)
     assert len(spectrum_imports) == 0, "Spectrum without peaks should be skipped"
 
 
-def test_load_from_json_with_minimal_json(tmp_path, builder):
-    filename = tmp_path / "test.json"
+def test_load_from_json_with_minimal_json(builder):
     body = '[{"test_field": "test1", "peaks_json": [[100.0, 10.0], [200.0, 10.0], [300.0, 500.0]]}]'
 
-    with open(filename, 'w', encoding="utf-8") as f:
-        f.write(body)
-
-    spectrum_imports = load_from_json(filename, metadata_harmonization=False)
+    spectrum_imports = load_from_json(io.StringIO(body), metadata_harmonization=False)
 
     expected = builder.with_metadata({"test_field": "test1"},
                                      metadata_harmonization=False).build()
@@ -94,16 +83,14 @@ def test_load_from_json_with_minimal_json(tmp_path, builder):
         expected], "Loaded JSON document not identical to expected Spectrum"
 
 
-def test_save_as_json_with_minimal_json(tmp_path, builder):
-    filename = tmp_path / "test.json"
-
+def test_save_as_json_with_minimal_json(builder):
     spectrum1 = builder.with_metadata({"test_field": "test1"},
                                       metadata_harmonization=False).build()
 
-    save_as_json([spectrum1], filename)
+    json_buffer = io.StringIO()
+    save_as_json([spectrum1], json_buffer)
 
-    with open(filename, encoding="utf-8") as f:
-        spectrum_imports = json.load(f)
+    spectrum_imports = json.loads(json_buffer.getvalue())
 
     expected = [{"test_field": "test1", "peaks_json": [
         [100.0, 10.0], [200.0, 10.0], [300.0, 500.0]]}]
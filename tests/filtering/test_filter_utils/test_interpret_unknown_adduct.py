@@ -1,6 +1,9 @@
+import numpy as np
 import pytest
-from matchms.filtering.filter_utils.interpret_unknown_adduct import \
-    get_multiplier_and_mass_from_adduct
+from matchms.filtering.filter_utils.interpret_unknown_adduct import (
+    get_charge_of_adduct, get_ions_from_adduct,
+    get_multiplier_and_mass_from_adduct, get_multiplier_and_mass_from_adducts,
+    split_ion)
 from matchms.filtering.filter_utils.load_known_adducts import \
     load_known_adducts
 
@@ -17,3 +20,72 @@ def test_get_multiplier_and_mass():
             f"The calculated multiplier: {multiplier} does not match the multiplier in the table: {exp_multiplier} for the adduct: {adduct}"
         assert round(correction_mass, 4) == round(exp_corr_mass, 4), \
         f"The calculated correction mass: {correction_mass} does not match the correction mass in the table: {exp_corr_mass} for the adduct: {adduct}"
+
+
+@pytest.mark.parametrize("adduct, expected", [
+    ["[M+H]+", (1.0, 1.00728)],
+    ["[M+H]+ \n", (1.0, 1.00728)],
+    ["[M+H]+*", (1.0, 1.00728)],
+    ["[M]+.", (1.0, -0.00055)],
+    ["[M+2H]2+", (0.5, 1.00728)],
+    ["[M-H]-/[M-Ser]", (None, None)],
+    ["[M+H][M+H]+", (None, None)],
+    ["[M+H]0+", (None, None)],
+    ["[M+H]", (None, None)]])
+def test_get_multiplier_and_mass_from_adduct(adduct, expected):
+    pytest.importorskip("rdkit")
+    multiplier, correction_mass = get_multiplier_and_mass_from_adduct(adduct)
+    if expected[0] is None:
+        assert multiplier is None and correction_mass is None
+    else:
+        assert multiplier == pytest.approx(expected[0])
+        assert correction_mass == pytest.approx(expected[1], abs=1e-5)
+
+
+def test_get_multiplier_and_mass_from_adducts():
+    pytest.importorskip("rdkit")
+    adducts = ["[M+H]+", "[2M+Na]+", None, "[M+H]+", "not an adduct", "[M+2H]2+"]
+    multipliers, correction_masses = get_multiplier_and_mass_from_adducts(adducts)
+    for adduct, multiplier, correction_mass in zip(adducts, multipliers, correction_masses):
+        expected_multiplier, expected_correction_mass = get_multiplier_and_mass_from_adduct(adduct)
+        if expected_multiplier is None:
+            assert np.isnan(multiplier) and np.isnan(correction_mass)
+        else:
+            assert multiplier == pytest.approx(expected_multiplier)
+            assert correction_mass == pytest.approx(expected_correction_mass)
+
+
+@pytest.mark.parametrize("adduct, expected", [
+    ["[M+H]+", (1, [("+", 1, "H")])],
+    ["[2M+Na-2H]-", (2, [("+", 1, "Na"), ("-", 2, "H")])],
+    ["[M+ACN+H]+", (1, [("+", 1, "CH3CN"), ("+", 1, "H")])],
+    ["M+H-H2O", (1, [("+", 1, "H"), ("-", 1, "H2O")])],
+    ["[M+H]", (1, [("+", 1, "H")])],
+    [" [M+H]+ ", (1, [("+", 1, "H")])],
+    ["[H+M]+", (None, None)],
+    ["[M+H+M]+", (None, None)],
+    ["[M+H]+/[M+Na]+", (None, None)]])
+def test_get_ions_from_adduct(adduct, expected):
+    assert get_ions_from_adduct(adduct) == expected
+
+
+@pytest.mark.parametrize("adduct, expected", [
+    ["[M+H]+", 1],
+    ["[M-H]-", -1],
+    ["[M+3H]3+", 3],
+    ["[M+2H]2-", -2],
+    ["[M+H]+ ", 1],
+    ["[M+H]", None],
+    ["[M+H]12+", None],
+    ["[M]+.", 1],
+    ["M+H]+", 1],
+    ["[M+H]+]+", None]])
+def test_get_charge_of_adduct(adduct, expected):
+    assert get_charge_of_adduct(adduct) == expected
+
+
+def test_split_ion():
+    assert split_ion("+2H2O") == ("+", 2, "H2O")
+    assert split_ion("-Na") == ("-", 1, "Na")
+    with pytest.raises(ValueError, match="Expected ion to start with"):
+        split_ion("H2O")
@@ -3,6 +3,7 @@ import numpy as np
 import pytest
 from matchms import Pipeline
 from matchms.filtering import select_by_mz
+from matchms.importing import load_from_msp
 from matchms.Pipeline import create_workflow
 from matchms.similarity import ModifiedCosine
 from matchms.yaml_file_functions import load_workflow_from_yaml_file
@@ -12,6 +13,12 @@ module_root = os.path.join(os.path.dirname(__file__), "..")
 spectrums_file_msp = os.path.join(module_root, "tests", "testdata", "massbank_five_spectra.msp")
 
 
+@pytest.fixture(scope="module")
+def spectrums():
+    """Spectra from spectrums_file_msp, loaded once for all tests (Pipeline does not modify them)."""
+    return list(load_from_msp(spectrums_file_msp))
+
+
 def test_pipeline_initial_check_missing_file():
     workflow = create_workflow(score_computations=[["precursormzmatch",  {"tolerance": 120.0}]])
     pipeline = Pipeline(workflow)
@@ -27,32 +34,31 @@ def test_pipeline_initial_check_unknown_step():
     assert "Unknown score computation:" in str(msg.value)
 
 
-def test_pipeline_symmetric():
-    workflow = create_workflow(predefined_processing_queries="basic",
-        score_computations=[["precursormzmatch",  {"tolerance": 120.0}],
-                                                   ["modifiedcosine", {"tolerance": 10.0}]])
-    pipeline = Pipeline(workflow)
-    pipeline.run(spectrums_file_msp)
-
-    assert len(pipeline.spectrums_queries) == 5
-    assert pipeline.spectrums_queries[0] == pipeline.spectrums_references[0]
-    assert pipeline.is_symmetric is True
-    assert pipeline.scores.scores.shape == (5, 5, 3)
-    assert pipeline.scores.score_names == ('PrecursorMzMatch', 'ModifiedCosine_score', 'ModifiedCosine_matches')
-    all_scores = pipeline.scores.to_array()
-    expected = np.array([[1., 0.30384404],
-                         [0.30384404, 1.]])
-    assert np.allclose(all_scores["ModifiedCosine_score"][3:, 3:], expected)
-    assert np.allclose(all_scores["ModifiedCosine_score"].diagonal(), 1), "Diagonal should all be 1.0"
-
-
-def test_pipeline_symmetric_filters():
-    workflow = create_workflow(predefined_processing_queries="basic",
-                               additional_filters_queries=[[select_by_mz, {"mz_from": 0, "mz_to": 1000}]],
-                               score_computations=[["precursormzmatch",  {"tolerance": 120.0}],
-                                                   ["modifiedcosine", {"tolerance": 10.0}]])
-    pipeline = Pipeline(workflow)
-    pipeline.run(spectrums_file_msp)
+def _workflow_from_yaml():
+    pytest.importorskip("rdkit")
+    return load_workflow_from_yaml_file(os.path.join(module_root, "tests", "test_pipeline.yaml"))
+
+
+@pytest.mark.parametrize("workflow_factory", [
+    lambda: create_workflow(predefined_processing_queries="basic",
+                            score_computations=[["precursormzmatch",  {"tolerance": 120.0}],
+                                                ["modifiedcosine", {"tolerance": 10.0}]]),
+    lambda: create_workflow(predefined_processing_queries="basic",
+                            additional_filters_queries=[[select_by_mz, {"mz_from": 0, "mz_to": 1000}]],
+                            score_computations=[["precursormzmatch",  {"tolerance": 120.0}],
+                                                ["modifiedcosine", {"tolerance": 10.0}]]),
+    lambda: create_workflow(predefined_processing_queries="basic",
+                            score_computations=[["precursormzmatch",  {"tolerance": 120.0}],
+                                                ["modifiedcosine", {"tolerance": 10.0}],
+                                                ["filter_by_range", {"low": 0.3, "above_operator": '>='}]]),
+    lambda: create_workflow(predefined_processing_queries="basic",
+                            score_computations=[["precursormzmatch",  {"tolerance": 120.0}],
+                                                [ModifiedCosine, {"tolerance": 10.0}]]),
+    _workflow_from_yaml,
+], ids=["basic", "filters", "masking", "custom_score", "from_yaml"])
+def test_pipeline_symmetric(workflow_factory, spectrums):
+    pipeline = Pipeline(workflow_factory())
+    pipeline.run(spectrums)
 
     assert len(pipeline.spectrums_queries) == 5
     assert pipeline.spectrums_queries[0].metadata == pipeline.spectrums_references[0].metadata
@@ -67,45 +73,6 @@ def test_pipeline_symmetric_filters():
     assert np.allclose(all_scores["ModifiedCosine_score"].diagonal(), 1), "Diagonal should all be 1.0"
 
 
-def test_pipeline_symmetric_masking():
-    workflow = create_workflow(predefined_processing_queries="basic",
-                               score_computations=[["precursormzmatch",  {"tolerance": 120.0}],
-                                   ["modifiedcosine", {"tolerance": 10.0}],
-                                   ["filter_by_range", {"low": 0.3, "above_operator": '>='}]])
-    pipeline = Pipeline(workflow)
-    pipeline.run(spectrums_file_msp)
-
-    assert len(pipeline.spectrums_queries) == 5
-    assert pipeline.spectrums_queries[0] == pipeline.spectrums_references[0]
-    assert pipeline.is_symmetric is True
-    assert pipeline.scores.scores.shape == (5, 5, 3)
-    assert pipeline.scores.score_names == ('PrecursorMzMatch', 'ModifiedCosine_score', 'ModifiedCosine_matches')
-    all_scores = pipeline.scores.to_array()
-    expected = np.array([[1., 0.30384404],
-                         [0.30384404, 1.]])
-    assert np.allclose(all_scores["ModifiedCosine_score"][3:, 3:], expected)
-    assert np.allclose(all_scores["ModifiedCosine_score"].diagonal(), 1), "Diagonal should all be 1.0"
-
-
-def test_pipeline_symmetric_custom_score():
-    workflow = create_workflow(predefined_processing_queries="basic",
-                               score_computations=[["precursormzmatch",  {"tolerance": 120.0}],
-                                                   [ModifiedCosine, {"tolerance": 10.0}]])
-    pipeline = Pipeline(workflow)
-    pipeline.run(spectrums_file_msp)
-
-    assert len(pipeline.spectrums_queries) == 5
-    assert pipeline.spectrums_queries[0] == pipeline.spectrums_references[0]
-    assert pipeline.is_symmetric is True
-    assert pipeline.scores.scores.shape == (5, 5, 3)
-    assert pipeline.scores.score_names == ('PrecursorMzMatch', 'ModifiedCosine_score', 'ModifiedCosine_matches')
-    all_scores = pipeline.scores.to_array()
-    expected = np.array([[1., 0.30384404],
-                         [0.30384404, 1.]])
-    assert np.allclose(all_scores["ModifiedCosine_score"][3:, 3:], expected)
-    assert np.allclose(all_scores["ModifiedCosine_score"].diagonal(), 1), "Diagonal should all be 1.0"
-
-
 def test_pipeline_non_symmetric():
     """Test importing from multiple files and different inputs for query and references."""
     workflow = create_workflow(predefined_processing_queries="basic",
@@ -128,24 +95,43 @@ def test_pipeline_non_symmetric():
     assert np.allclose(all_scores["ModifiedCosine_score"][8:, 3:], expected)
 
 
-def test_pipeline_from_yaml():
-    pytest.importorskip("rdkit")
-    config_file = os.path.join(module_root, "tests", "test_pipeline.yaml")
-    workflow = load_workflow_from_yaml_file(config_file)
+def test_pipeline_spectra_not_in_a_list(spectrums):
+    workflow = create_workflow(score_computations=[["modifiedcosine", {"tolerance": 10.0}]])
     pipeline = Pipeline(workflow)
-    pipeline.run(spectrums_file_msp)
+    pipeline.run(tuple(spectrums), (spectrum for spectrum in spectrums))
+
     assert len(pipeline.spectrums_queries) == 5
-    assert pipeline.spectrums_queries[0] == pipeline.spectrums_references[0]
-    assert pipeline.is_symmetric is True
-    assert pipeline.scores.scores.shape == (5, 5, 3)
-    assert pipeline.scores.score_names == ('PrecursorMzMatch', 'ModifiedCosine_score', 'ModifiedCosine_matches')
-    all_scores = pipeline.scores.to_array()
-    expected = np.array([[1., 0.30384404],
-                         [0.30384404, 1.]])
-    assert np.allclose(all_scores["ModifiedCosine_score"][3:, 3:], expected)
+    assert len(pipeline.spectrums_references) == 5
+    assert pipeline.scores.scores.shape == (5, 5, 2)
 
 
-def test_pipeline_to_and_from_yaml(tmp_path):
+def test_pipeline_spectra_with_none(spectrums):
+    workflow = create_workflow(score_computations=[["modifiedcosine", {"tolerance": 10.0}]])
+    pipeline = Pipeline(workflow)
+    pipeline.run([spectrums[0], None, spectrums[1]])
+
+    assert len(pipeline.spectrums_queries) == 2
+    assert pipeline.scores.scores.shape == (2, 2, 2)
+
+
+@pytest.mark.parametrize("query_files, expected_error, expected_message", [
+    [[], ValueError, "got nothing"],
+    [[None], ValueError, "got nothing"],
+    [5, TypeError, "not int"],
+])
+def test_pipeline_unsupported_input(query_files, expected_error, expected_message):
+    pipeline = Pipeline(create_workflow())
+    with pytest.raises(expected_error, match=expected_message):
+        pipeline.run(query_files)
+
+
+def test_pipeline_mixed_spectra_and_files(spectrums):
+    pipeline = Pipeline(create_workflow())
+    with pytest.raises(TypeError, match="Spectrum, str"):
+        pipeline.run([spectrums[0], spectrums_file_msp])
+
+
+def test_pipeline_to_and_from_yaml(tmp_path, spectrums):
     pytest.importorskip("rdkit")
     config_file = os.path.join(tmp_path, "test_pipeline.yaml")
 
@@ -154,13 +140,13 @@ def test_pipeline_to_and_from_yaml(tmp_path):
     assert os.path.exists(config_file)
 
     pipeline = Pipeline(workflow)
-    pipeline.run(spectrums_file_msp)
+    pipeline.run(spectrums)
     scores_run1 = pipeline.scores
 
     # Load again
     workflow = load_workflow_from_yaml_file(config_file)
     pipeline = Pipeline(workflow)
-    pipeline.run(spectrums_file_msp)
+    pipeline.run(spectrums)
     assert pipeline.scores.scores == scores_run1.scores
 
 
@@ -178,7 +164,7 @@ def test_pipeline_logging(tmp_path):
     assert "Start running matchms pipeline" in firstline
 
 
-def test_FingerprintSimilarity_pipeline():
+def test_FingerprintSimilarity_pipeline(spectrums):
     pytest.importorskip("rdkit")
     workflow = create_workflow(predefined_processing_queries="basic",
                                additional_filters_queries=["add_fingerprint"],
@@ -188,13 +174,14 @@ def test_FingerprintSimilarity_pipeline():
                                                    ["fingerprintsimilarity", {"similarity_measure": "jaccard"}]],
                                )
     pipeline = Pipeline(workflow)
-    pipeline.run(spectrums_file_msp, spectrums_file_msp)
+    pipeline.run(spectrums, spectrums)
     assert len(pipeline.spectrums_queries[0].get("fingerprint")) == 2048
     assert pipeline.scores.scores.shape == (5, 5, 2)
     assert pipeline.scores.score_names == ('MetadataMatch', 'FingerprintSimilarity')
+    assert spectrums[0].get("fingerprint") is None, "The loaded input spectra should not be modified"
 
 
-def test_pipeline_changing_workflow():
+def test_pipeline_changing_workflow(spectrums):
     """Test if changing workflow after creating Pipeline results in the expected change of the pipeline"""
     workflow = create_workflow(predefined_processing_queries=None,
                                additional_filters_queries=["make_charge_int"],
@@ -206,7 +193,7 @@ def test_pipeline_changing_workflow():
     pipeline.query_filters = ["add_fingerprint"]
     pipeline.reference_filters = ["add_fingerprint"]
     pipeline.score_computations = [["modifiedcosine", {"tolerance": 10.0}]]
-    pipeline.run(spectrums_file_msp, spectrums_file_msp)
+    pipeline.run(spectrums, spectrums)
     assert len(pipeline.spectrums_queries[0].get("fingerprint")) == 2048, \
         "The query filters were not modified correctly"
     assert len(pipeline.spectrums_references[0].get("fingerprint")) == 2048, \